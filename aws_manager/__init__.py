@@ -10,15 +10,31 @@ A collection of utilities for managing AWS resources, including:
 
 __version__ = "0.1.0"
 
-from .core import (
-    LandingZone,
-    LandingZoneManager,
-    AWSSession,
-    SessionManager,
-    ResourceScanner,
-    Resource,
-)
-from .monitoring import AlarmManager, MetricConfig, AlarmConfig
+from importlib import import_module
+
+# Public names are resolved from their submodules on first access (PEP 562),
+# so importing one of them doesn't load the rest of the package
+_LAZY_IMPORTS = {
+    "LandingZone": ".core",
+    "LandingZoneManager": ".core",
+    "AWSSession": ".core",
+    "SessionManager": ".core",
+    "ResourceScanner": ".core",
+    "Resource": ".core",
+    "AlarmManager": ".monitoring",
+    "AlarmConfigManager": ".monitoring",
+    "MetricConfig": ".monitoring",
+    "AlarmConfig": ".monitoring",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Landing Zone related
@@ -29,6 +45,7 @@ __all__ = [
     "SessionManager",
     # Monitoring related
     "AlarmManager",
+    "AlarmConfigManager",
     # Resource related
     "ResourceScanner",
     "Resource",
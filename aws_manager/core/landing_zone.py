@@ -2,13 +2,14 @@ import yaml
 import logging
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple, Union
 from utils import load_yaml
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LandingZone:
     name: str
     env: str
@@ -17,38 +18,41 @@ class LandingZone:
     category: str
 
 
-class LandingZoneManager:
-    _lz_configs: List[LandingZone] = []
+# The YAML is parsed once per process by load_yaml; the landing zones are
+# immutable, hence tuples and a read-only name index.
+def _load_lz_configs(
+    lz_file: Path,
+) -> Tuple[Tuple[LandingZone, ...], Mapping[str, LandingZone]]:
+    try:
+        data = load_yaml(lz_file)
+        lz_configs = tuple(
+            LandingZone(
+                name=f"{lz['landing_zone']}{env}",
+                env=env,
+                account_id=account_id,
+                app_id=lz.get("app_id", "CMS"),
+                category=lz.get("category", "CAT_D"),
+            )
+            for lz in data
+            for env, account_id in lz.get("environments", {}).items()
+            if account_id
+        )
+        logger.info("Loaded %d landing zones", len(lz_configs))
+    except (FileNotFoundError, yaml.YAMLError) as e:
+        logger.error("Error loading config: %s", e)
+        lz_configs = ()
+    # Reversed so the first landing zone wins if a name is repeated
+    lz_by_name = {lz.name: lz for lz in reversed(lz_configs)}
+    return lz_configs, MappingProxyType(lz_by_name)
+
 
+class LandingZoneManager:
     def __init__(self, lz_file: Union[str, Path]):
-        if not self._lz_configs:
-            self._load_lz_configs(lz_file)
-
-    @classmethod
-    def _load_lz_configs(cls, lz_file: Union[str, Path]) -> None:
-        try:
-            data = load_yaml(lz_file)
-            cls._lz_configs = [
-                LandingZone(
-                    name=f"{lz['landing_zone']}{env}",
-                    env=env,
-                    account_id=account_id,
-                    app_id=lz.get("app_id", "CMS"),
-                    category=lz.get("category", "CAT_D"),
-                )
-                for lz in data
-                for env, account_id in lz.get("environments", {}).items()
-                if account_id
-            ]
-            logger.info(f"Loaded {len(cls._lz_configs)} landing zones")
-        except (FileNotFoundError, yaml.YAMLError) as e:
-            logger.error(f"Error loading config: {e}")
-            cls._lz_configs = []
-
-    @classmethod
-    def get_all_landing_zones(cls) -> List[LandingZone]:
-        return cls._lz_configs
-
-    @classmethod
-    def get_landing_zone(cls, lz_name: str) -> Optional[LandingZone]:
-        return next((lz for lz in cls._lz_configs if lz.name == lz_name), None)
+        lz_path = Path(lz_file).resolve()
+        self._lz_configs, self._lz_by_name = _load_lz_configs(lz_path)
+
+    def get_all_landing_zones(self) -> Tuple[LandingZone, ...]:
+        return self._lz_configs
+
+    def get_landing_zone(self, lz_name: str) -> Optional[LandingZone]:
+        return self._lz_by_name.get(lz_name)
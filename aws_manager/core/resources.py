@@ -1,13 +1,12 @@
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from botocore.exceptions import BotoCoreError, ClientError
 from .session import AWSSession
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Resource:
     type: str
     name: str
@@ -21,11 +20,20 @@ class ResourceScanner:
     }
 
     def __init__(self, session: AWSSession, region_name: Optional[str] = None):
-        self.client = session.session.client(
-            "resourcegroupstaggingapi",
-            region_name=region_name or getattr(session, "region_name", None),
-        )
+        self._session = session
+        self._region_name = region_name or getattr(session, "region_name", None)
         self._managed_resources: List[Resource] = []
+        # Tag scans made by this scanner, keyed by tags and resource types.
+        # Each landing zone builds its own scanner, so nothing is shared
+        # between worker threads or outlives the scanner.
+        self._scan_cache: Dict[Tuple, List[Resource]] = {}
+
+    @property
+    def client(self):
+        """Tagging API client, created on first use; cached scans never need it."""
+        return self._session.client(
+            "resourcegroupstaggingapi", region_name=self._region_name
+        )
 
     def get_managed_resources(self, env: str) -> List[Resource]:
         tags = {"managed_by": "CMS"}
@@ -44,35 +52,72 @@ class ResourceScanner:
         if not tags:
             raise ValueError("At least one tag must be provided")
 
+        cache_key = (
+            tuple(sorted(tags.items())),
+            tuple(
+                (resource_type, config["type"], config["delimiter"])
+                for resource_type, config in resource_config.items()
+            ),
+        )
+        if cache_key in self._scan_cache:
+            return list(self._scan_cache[cache_key])
+
+        # One paginated call covers every resource type; each ARN is mapped
+        # back to its type via a (service, resource type) tuple parsed from
+        # the "<service>:<resource type>" filter, e.g. ("ec2", "instance"),
+        # so no key string is built per ARN
+        type_lookup = {
+            tuple(config["type"].split(":", 1)): (resource_type, config["delimiter"])
+            for resource_type, config in resource_config.items()
+        }
+        items = self._fetch_resources_from_aws(
+            tags, [config["type"] for config in resource_config.values()]
+        )
+        if items is None:
+            return []
+
         all_resources = []
-        for resource_type, config in resource_config.items():
-            resources = self._fetch_resources_from_aws(tags, config["type"])
-            for item in resources:
-                resource_name = next(
-                    (
-                        tag["Value"]
-                        for tag in item.get("Tags", [])
-                        if tag["Key"] == "Name"
-                    ),
-                    "Unnamed",
-                )
-                resource = Resource(
+        lookup_type = type_lookup.get
+        for item in items:
+            arn = item["ResourceARN"]
+            _, _, service, _, _, resource_part = arn.split(":", 5)
+            type_token = resource_part.split("/", 1)[0].split(":", 1)[0]
+            match = lookup_type((service, type_token))
+            if not match:
+                logger.debug("Skipping resource with unexpected ARN: %s", arn)
+                continue
+
+            resource_type, delimiter = match
+            tag_map = {tag["Key"]: tag.get("Value", "") for tag in item.get("Tags", ())}
+            all_resources.append(
+                Resource(
                     type=resource_type,
-                    name=resource_name,
-                    id=item["ResourceARN"].split(config["delimiter"])[-1],
+                    name=tag_map.get("Name", "Unnamed"),
+                    id=arn.rsplit(delimiter, 1)[-1],
                 )
-                all_resources.append(resource)
+            )
+
+        self._scan_cache[cache_key] = list(all_resources)
         return all_resources
 
     def _fetch_resources_from_aws(
-        self, tags: Dict[str, str], resource_type: str
-    ) -> List[Dict]:
+        self, tags: Dict[str, str], resource_types: List[str]
+    ) -> Optional[List[Dict]]:
+        """Fetch all tagged resources of the given types, or None if AWS failed."""
+        from botocore.exceptions import BotoCoreError, ClientError
+
         try:
-            response = self.client.get_resources(
+            paginator = self.client.get_paginator("get_resources")
+            pages = paginator.paginate(
                 TagFilters=[{"Key": k, "Values": [v]} for k, v in tags.items()],
-                ResourceTypeFilters=[resource_type],
+                ResourceTypeFilters=resource_types,
+                PaginationConfig={"PageSize": 100},
             )
-            return response.get("ResourceTagMappingList", [])
+            return [
+                item
+                for page in pages
+                for item in page.get("ResourceTagMappingList", [])
+            ]
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"AWS resource fetch failed: {e}")
-            return []
+            logger.error("AWS resource fetch failed: %s", e)
+            return None
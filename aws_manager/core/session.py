@@ -1,31 +1,78 @@
-import boto3
+import os
+import json
 import logging
-from dataclasses import dataclass
-from typing import Optional, Dict
+from pathlib import Path
+from threading import Lock
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Optional, Dict, Tuple
 from datetime import datetime, timezone
 from .landing_zone import LandingZone
 
+# boto3/botocore take most of the CLI's import time, so they are imported on
+# first use rather than when the package is loaded (e.g. for --help).
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_REGION = "ap-southeast-1"
 
+# Assumed-role credentials are kept next to the AWS CLI's own cache, in its
+# format, and reused across runs while they have CREDENTIALS_MIN_TTL left
+CREDENTIALS_CACHE_DIR = Path.home() / ".aws" / "cli" / "cache"
+CREDENTIALS_MIN_TTL = 300
+
+
+@lru_cache(maxsize=None)
+def _client_config() -> "Config":
+    """
+    Config shared by every client built from an AWSSession: enough pooled
+    connections for the worker threads, adaptive retries to absorb throttling,
+    and TCP keepalive so pooled connections survive between bursts.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=20,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+    )
+
 
 @dataclass
 class AWSSession:
-    session: boto3.Session
+    session: "boto3.Session"
     aws_access_key: str
     aws_secret_key: str
     security_token: str
     expire_date: str
     default_region: str = DEFAULT_REGION
+    _clients: Dict[Tuple[str, Optional[str]], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _clients_lock: Lock = field(
+        default_factory=Lock, init=False, repr=False, compare=False
+    )
+
+    def client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+        """Get a cached boto3 client for the service, creating it on first use."""
+        key = (service_name, region_name)
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = self.session.client(
+                    service_name, region_name=region_name, config=_client_config()
+                )
+            return self._clients[key]
 
     def is_valid(self) -> bool:
         """Check if the current session is valid and not expired."""
         try:
-            self.session.client("sts").get_caller_identity()
+            self.client("sts").get_caller_identity()
             return datetime.fromisoformat(self.expire_date) > datetime.now(timezone.utc)
         except Exception as e:
-            logger.error(f"Session validation failed: {e}")
+            logger.error("Session validation failed: %s", e)
             return False
 
     @property
@@ -36,41 +83,173 @@ class AWSSession:
             now = datetime.now(timezone.utc)
             return (expire_dt - now).total_seconds() if expire_dt > now else None
         except ValueError as e:
-            logger.error(f"Invalid expiration date format: {e}")
+            logger.error("Invalid expiration date format: %s", e)
             return None
 
 
-def assume_role(
-    lz: LandingZone, role: str, region: str, role_session_name: str
+def _credentials_cache_path(lz: LandingZone, role: str, role_session_name: str) -> Path:
+    # The session name is part of the key so differently named sessions for
+    # the same role don't share (and overwrite) each other's credentials
+    return (
+        CREDENTIALS_CACHE_DIR
+        / f"cms-{lz.account_id}-{role}-{lz.name}-{role_session_name}.json"
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_data_loader() -> Any:
+    """
+    botocore loader shared by all landing zone sessions, so the service models
+    behind each client are read and parsed once per process, not per session.
+    """
+    from botocore.loaders import create_loader
+
+    return create_loader()
+
+
+def _session_from_credentials(
+    credentials: Dict[str, str],
+    region: str,
+    refresh_using: Callable[[], Dict[str, str]],
 ) -> AWSSession:
-    """Assumes a specified role in an AWS account."""
-    role_arn = f"arn:aws:iam::{lz.account_id}:role/{role}"
-    try:
-        sts_creds = boto3.client("sts").assume_role(
-            RoleArn=role_arn, RoleSessionName=f"{lz.name}-{role_session_name}"
-        )["Credentials"]
+    """
+    Build a session whose credentials botocore refreshes through refresh_using
+    shortly before they expire, so long runs don't fail with ExpiredToken.
+    """
+    import boto3
+    import botocore.session
+    from botocore.credentials import RefreshableCredentials
 
-        session = boto3.Session(
-            aws_access_key_id=sts_creds["AccessKeyId"],
-            aws_secret_access_key=sts_creds["SecretAccessKey"],
-            aws_session_token=sts_creds["SessionToken"],
-            region_name=region,
+    botocore_session = botocore.session.get_session()
+    botocore_session.register_component("data_loader", _shared_data_loader())
+    botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_refresh_metadata(credentials),
+        refresh_using=refresh_using,
+        method="sts-assume-role",
+    )
+    session = boto3.Session(region_name=region, botocore_session=botocore_session)
+    return AWSSession(
+        session=session,
+        aws_access_key=credentials["AccessKeyId"],
+        aws_secret_key=credentials["SecretAccessKey"],
+        security_token=credentials["SessionToken"],
+        expire_date=credentials["Expiration"],
+    )
+
+
+def _refresh_metadata(credentials: Dict[str, str]) -> Dict[str, str]:
+    """Convert STS-style credentials to the format RefreshableCredentials uses."""
+    return {
+        "access_key": credentials["AccessKeyId"],
+        "secret_key": credentials["SecretAccessKey"],
+        "token": credentials["SessionToken"],
+        "expiry_time": credentials["Expiration"],
+    }
+
+
+def _credentials_refresher(
+    lz: LandingZone, role: str, region: str, role_session_name: str
+) -> Callable[[], Dict[str, str]]:
+    def refresh() -> Dict[str, str]:
+        logger.info("Refreshing credentials for %s", lz.name)
+        return _refresh_metadata(
+            _assume_role_credentials(lz, role, region, role_session_name)
         )
 
-        return AWSSession(
-            session=session,
-            aws_access_key=sts_creds["AccessKeyId"],
-            aws_secret_key=sts_creds["SecretAccessKey"],
-            security_token=sts_creds["SessionToken"],
-            expire_date=sts_creds["Expiration"].isoformat(),
+    return refresh
+
+
+def _load_cached_session(
+    lz: LandingZone, role: str, region: str, role_session_name: str
+) -> Optional[AWSSession]:
+    """Build a session from cached credentials that are not close to expiring."""
+    try:
+        with open(_credentials_cache_path(lz, role, role_session_name)) as file:
+            session = _session_from_credentials(
+                json.load(file)["Credentials"],
+                region,
+                _credentials_refresher(lz, role, region, role_session_name),
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    expires_in = session.expires_in_seconds
+    if expires_in is None or expires_in < CREDENTIALS_MIN_TTL:
+        return None
+    logger.debug("Reusing cached credentials for %s", lz.name)
+    return session
+
+
+def _save_cached_credentials(
+    lz: LandingZone, role: str, role_session_name: str, credentials: Dict[str, str]
+) -> None:
+    """Write credentials readable by the current user only; failures are ignored."""
+    cache_path = _credentials_cache_path(lz, role, role_session_name)
+    try:
+        CREDENTIALS_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump({"Credentials": credentials}, file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to cache credentials for %s: %s", lz.name, e)
+
+
+def _assume_role_credentials(
+    lz: LandingZone, role: str, region: str, role_session_name: str
+) -> Dict[str, str]:
+    """Call STS AssumeRole and cache the resulting credentials on disk."""
+    import boto3
+    import botocore.session
+
+    role_arn = f"arn:aws:iam::{lz.account_id}:role/{role}"
+    try:
+        # A fresh Session per call: boto3's shared default session is not
+        # safe to create from several threads at once. The regional STS
+        # endpoint avoids the round trip to the global us-east-1 endpoint;
+        # older botocore releases default to the global one.
+        botocore_session = botocore.session.get_session()
+        botocore_session.register_component("data_loader", _shared_data_loader())
+        botocore_session.set_config_variable("sts_regional_endpoints", "regional")
+        sts_client = boto3.Session(botocore_session=botocore_session).client(
+            "sts", region_name=region, config=_client_config()
         )
+        sts_creds = sts_client.assume_role(
+            RoleArn=role_arn, RoleSessionName=f"{lz.name}-{role_session_name}"
+        )["Credentials"]
     except Exception as e:
-        logger.error(f"Failed to assume role {role_arn}: {e}")
+        logger.error("Failed to assume role %s: %s", role_arn, e)
         raise
 
+    credentials = {
+        "AccessKeyId": sts_creds["AccessKeyId"],
+        "SecretAccessKey": sts_creds["SecretAccessKey"],
+        "SessionToken": sts_creds["SessionToken"],
+        "Expiration": sts_creds["Expiration"].isoformat(),
+    }
+    _save_cached_credentials(lz, role, role_session_name, credentials)
+    return credentials
+
+
+def assume_role(
+    lz: LandingZone, role: str, region: str, role_session_name: str
+) -> AWSSession:
+    """Assumes a specified role in an AWS account."""
+    return _session_from_credentials(
+        _assume_role_credentials(lz, role, region, role_session_name),
+        region,
+        _credentials_refresher(lz, role, region, role_session_name),
+    )
+
 
 class SessionManager:
     _sessions: Dict[str, AWSSession] = {}
+    # Landing zones are bootstrapped from parallel threads: one lock per
+    # session key lets different accounts assume roles concurrently while
+    # callers for the same account wait for a single AssumeRole call
+    _session_locks: Dict[str, Lock] = {}
+    _session_locks_lock = Lock()
 
     @classmethod
     def get_or_create_session(
@@ -78,13 +257,22 @@ class SessionManager:
     ) -> AWSSession:
         session_key = f"{lz.account_id}:{role}"
 
-        if session_key in cls._sessions and cls._sessions[session_key].is_valid():
+        # Cached sessions refresh their own credentials before they expire
+        if session_key in cls._sessions:
             return cls._sessions[session_key]
 
-        new_session = assume_role(lz, role, region, role_session_name)
-        if new_session:
-            cls._sessions[session_key] = new_session
-        return new_session
+        with cls._session_locks_lock:
+            session_lock = cls._session_locks.setdefault(session_key, Lock())
+        with session_lock:
+            if session_key in cls._sessions:
+                return cls._sessions[session_key]
+
+            new_session = _load_cached_session(
+                lz, role, region, role_session_name
+            ) or assume_role(lz, role, region, role_session_name)
+            if new_session:
+                cls._sessions[session_key] = new_session
+            return new_session
 
     @classmethod
     def cleanup_session(cls, session: AWSSession) -> None:
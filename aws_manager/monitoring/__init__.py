@@ -1,4 +1,5 @@
 from .alarm_manager import AlarmManager
 from .alarm_config import MetricConfig, AlarmConfig
+from .alarm_config_manager import AlarmConfigManager
 
-__all__ = ["AlarmManager", "MetricConfig", "AlarmConfig"]
+__all__ = ["AlarmManager", "AlarmConfigManager", "MetricConfig", "AlarmConfig"]
@@ -3,8 +3,11 @@ from typing import List, Optional, Union
 
 from .metric_config import MetricConfig
 
+# Characters stripped from metric names when building alarm names
+_SANITIZE_TABLE = str.maketrans("", "", " %")
 
-@dataclass
+
+@dataclass(slots=True)
 class AlarmConfig:
     """Configuration for a CloudWatch alarm"""
 
@@ -21,7 +24,7 @@ class AlarmConfig:
 
     def metric_name(self) -> str:
         """Generate a cleaned metric name without spaces and special characters."""
-        return self.metric.name.translate(str.maketrans("", "", " %"))
+        return self.metric.name.translate(_SANITIZE_TABLE)
 
     def __bool__(self) -> bool:
         return bool(self.name)
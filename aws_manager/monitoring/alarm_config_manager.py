@@ -1,27 +1,62 @@
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from threading import Lock
-from .alarm_config import AlarmConfig, MetricConfig
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Any
+from .alarm_config import AlarmConfig
+from .metric_config import MetricConfig
 from utils import load_yaml
 
 logger = logging.getLogger(__name__)
 
 
-class AlarmConfigManager:
-    _instance: Optional["AlarmConfigManager"] = None
-    _lock = Lock()
+# The parsed YAML comes from load_yaml's cache and is shared between
+# AlarmConfigManager instances, so callers must treat it as read-only.
+# Alarm configs are returned as a read-only mapping of tuples to enforce this.
+def _load_alarm_configs(path: Path) -> Mapping[str, Tuple[AlarmConfig, ...]]:
+    try:
+        data = load_yaml(path)
+        alarm_configs = {
+            resource_type: tuple(
+                AlarmConfig(
+                    metric=MetricConfig(
+                        name=config["metric"]["name"],
+                        namespace=config["metric"]["namespace"],
+                    ),
+                    statistic=config["statistic"],
+                    comparison_operator=config["comparison_operator"],
+                    unit=config["unit"],
+                    period=config["period"],
+                    evaluation_periods=config["evaluation_periods"],
+                )
+                for config in configs
+            )
+            for resource_type, configs in data.items()
+        }
+        return MappingProxyType(alarm_configs)
+    except Exception as e:
+        logger.error("Error loading alarm configs: %s", e)
+        raise
+
+
+def _load_category_configs(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        return load_yaml(path)
+    except Exception as e:
+        logger.error("Error loading category configs: %s", e)
+        raise
+
+
+def _load_custom_configs(path: Path) -> Dict[str, Any]:
+    try:
+        return load_yaml(path)
+    except Exception as e:
+        logger.error("Error loading custom configs: %s", e)
+        raise
 
-    def __new__(cls) -> "AlarmConfigManager":
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialize()
-            return cls._instance
 
-    def _initialize(self) -> None:
-        """Initialize instance attributes with proper type hints."""
-        self.alarm_configs: Dict[str, List[AlarmConfig]] = {}
+class AlarmConfigManager:
+    def __init__(self) -> None:
+        self.alarm_configs: Mapping[str, Tuple[AlarmConfig, ...]] = {}
         self.category_configs: Dict[str, Dict[str, Any]] = {}
         self.custom_configs: Dict[str, Any] = {}
 
@@ -33,6 +68,7 @@ class AlarmConfigManager:
     ) -> None:
         """
         Load all configuration files into the instance attributes.
+        Each file is parsed once per process by load_yaml and reused until it changes.
 
         Args:
             alarm_config_path: Path to alarm configuration file
@@ -43,57 +79,12 @@ class AlarmConfigManager:
             FileNotFoundError: If any config file is not found
             ValueError: If config files contain invalid data
         """
-        self._validate_paths(
-            alarm_config_path, category_config_path, custom_config_path
-        )
-
-        if not self.alarm_configs:
-            self.alarm_configs = self._load_alarm_configs(alarm_config_path)
-        if not self.category_configs:
-            self.category_configs = self._load_category_configs(category_config_path)
-        if not self.custom_configs:
-            self.custom_configs = self._load_custom_configs(custom_config_path)
-
-    def _load_alarm_configs(self, path: Path) -> Dict[str, List[AlarmConfig]]:
-        try:
-            data = load_yaml(path)
-            alarm_configs = {
-                resource_type: [
-                    AlarmConfig(
-                        metric=MetricConfig(
-                            name=config["metric"]["name"],
-                            namespace=config["metric"]["namespace"],
-                        ),
-                        statistic=config["statistic"],
-                        comparison_operator=config["comparison_operator"],
-                        unit=config["unit"],
-                        period=config["period"],
-                        evaluation_periods=config["evaluation_periods"],
-                    )
-                    for config in configs
-                ]
-                for resource_type, configs in data.items()
-            }
-            return alarm_configs
-        except Exception as e:
-            logger.error(f"Error loading alarm configs: {e}")
-            raise
+        # A missing file surfaces as FileNotFoundError from load_yaml
+        self.alarm_configs = _load_alarm_configs(alarm_config_path)
+        self.category_configs = _load_category_configs(category_config_path)
+        self.custom_configs = _load_custom_configs(custom_config_path)
 
-    def _load_category_configs(self, path: Path) -> Dict[str, Dict[str, Any]]:
-        try:
-            return load_yaml(path)
-        except Exception as e:
-            logger.error(f"Error loading category configs: {e}")
-            raise
-
-    def _load_custom_configs(self, path: Path) -> Dict[str, Any]:
-        try:
-            return load_yaml(path)
-        except Exception as e:
-            logger.error(f"Error loading custom configs: {e}")
-            raise
-
-    def get_alarm_configs(self) -> Dict[str, List[AlarmConfig]]:
+    def get_alarm_configs(self) -> Mapping[str, Tuple[AlarmConfig, ...]]:
         return self.alarm_configs
 
     def get_category_configs(self) -> Dict[str, Dict[str, Any]]:
@@ -101,9 +92,3 @@ class AlarmConfigManager:
 
     def get_custom_configs(self) -> Dict[str, Any]:
         return self.custom_configs
-
-    def _validate_paths(self, *paths: Path) -> None:
-        """Validate that all provided paths exist."""
-        for path in paths:
-            if not path.exists():
-                raise FileNotFoundError(f"Config file not found: {path}")
@@ -1,15 +1,30 @@
+import sys
+import json
+import time
 import logging
 from pathlib import Path
-from copy import deepcopy
-from typing import Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from threading import Lock
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from ..core import LandingZone, AWSSession, Resource, ResourceScanner
+from ..core import LandingZone, AWSSession, Resource
 from .alarm_config import AlarmConfig, Alarms
 from .metric_config import MetricConfig, CWAgentMetrics
 
 from .constants import *
 from .alarm_config_manager import AlarmConfigManager
+from .rate_limiter import RateLimiter
+
+try:
+    # orjson encodes and decodes the on-disk caches several times faster
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +35,11 @@ class AlarmManager:
     Handles alarm configuration, creation, and deployment.
     """
 
+    # PutMetricAlarm quota is per account and region, and landing zones that
+    # share an account may deploy concurrently, so they share one limiter
+    _put_alarm_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+    _put_alarm_rate_limiters_lock = Lock()
+
     #### Initialization Methods ####
     def __init__(
         self,
@@ -29,11 +49,35 @@ class AlarmManager:
         alarm_config_path: Path,
         category_config_path: Path,
         custom_config_path: Path,
+        use_cache: bool = True,
     ) -> None:
         # AWS and Resource related
         self.landing_zone = landing_zone
         self.aws_session = aws_session
         self.monitored_resources = monitored_resources
+        self._cw_client = aws_session.client("cloudwatch")
+        self._put_alarm_rate_limiter = self._get_put_alarm_rate_limiter(
+            landing_zone.account_id, DEFAULT_REGION
+        )
+        self._alarm_name_prefix = f"{landing_zone.name}-"
+        # Without the cache, existing alarms and CWAgent metrics are always
+        # fetched live; the fresh results are still written for later runs
+        self._use_cache = use_cache
+        self._existing_alarms_cache_path = (
+            EXISTING_ALARMS_CACHE_DIR
+            / f"{landing_zone.account_id}-{DEFAULT_REGION}-{landing_zone.name}-alarms.json"
+        )
+        self._cwagent_metrics_cache_path = (
+            EXISTING_ALARMS_CACHE_DIR
+            / f"{landing_zone.account_id}-{DEFAULT_REGION}-{landing_zone.name}-cwagent-metrics.json"
+        )
+        # Tags shared by every alarm of this landing zone, built once per run
+        self._constant_tags = (
+            {"Key": "AppID", "Value": landing_zone.app_id},
+            {"Key": "Environment", "Value": landing_zone.env},
+            {"Key": "ResourceType", "Value": "CloudWatchAlarm"},
+            {"Key": MANAGE_BY_TAG_KEY, "Value": CMS_MANAGED_TAG_VALUE},
+        )
 
         # Load configurations
         self._load_configurations(
@@ -43,6 +87,13 @@ class AlarmManager:
         # Load states
         self._load_states()
 
+    @classmethod
+    def _get_put_alarm_rate_limiter(cls, account_id: str, region: str) -> RateLimiter:
+        with cls._put_alarm_rate_limiters_lock:
+            return cls._put_alarm_rate_limiters.setdefault(
+                (account_id, region), RateLimiter(PUT_METRIC_ALARM_TPS)
+            )
+
     def _load_configurations(
         self,
         alarm_config_path: Path,
@@ -62,80 +113,210 @@ class AlarmManager:
             self.landing_zone.category, {}
         )
         self._threshold_configs = self._category_configs.get("thresholds", {})
+        self._thresholds = {
+            (resource_type, metric_name): threshold
+            for resource_type, metric_thresholds in self._threshold_configs.items()
+            for metric_name, threshold in (metric_thresholds or {}).items()
+        }
         self._sns_topics = self._category_configs.get("sns_topic_arns", [])
 
+        # SNS topic ARNs, resolved once for this landing zone's account and category
+        sns_prefix = f"arn:aws:sns:{DEFAULT_REGION}:{self.landing_zone.account_id}:"
+        self._default_sns_topic_arns = [
+            sns_prefix + topic for topic in self._sns_topics
+        ]
+        self._sns_topic_arns = {
+            (resource_type, metric_name): [
+                sns_prefix + topic
+                for topic in mapping.get("sns_topics", self._sns_topics)
+            ]
+            for resource_type, metric_mappings in self._custom_configs.get(
+                "sns_mappings", {}
+            ).items()
+            for metric_name, mapping in metric_mappings.items()
+            if mapping and self.landing_zone.category in mapping.get("categories", [])
+        }
+
+        lz_disabled_alarms = self._custom_configs.get("disabled_alarms", {}).get(
+            self.landing_zone.name, {}
+        )
+        self._disabled_alarms = frozenset(
+            (resource_type, metric_name)
+            for resource_type, metric_names in lz_disabled_alarms.items()
+            for metric_name in metric_names
+        )
+
+        # Enabled alarm configs per resource type, paired with the alarm name
+        # suffix, so building a resource's names is only a prefix concatenation
+        self._enabled_alarm_configs = {
+            resource_type: tuple(
+                (alarm_config.metric_name(), alarm_config)
+                for alarm_config in alarm_configs
+                if not self._is_disabled_alarm(resource_type, alarm_config.metric.name)
+            )
+            for resource_type, alarm_configs in self._alarm_configs.items()
+        }
+
     def _load_states(self):
         self._existing_alarms = set()
+        # When the existing alarms were last scanned from CloudWatch, and
+        # whether they came from the on-disk cache rather than a scan this run
+        self._existing_alarms_scanned_at: Optional[float] = None
+        self._existing_alarms_from_cache = False
         self._cwagent_metrics = CWAgentMetrics()
-        self._monitored_ec2 = {
-            resource.id
-            for resource in self.monitored_resources
-            if resource.type == "EC2"
-        }
-        self._rds_storage_map = self._get_rds_storage_map()
-        self._scan_existing_alarms()
-        self._fetch_cwagent_metrics()
+        self._dimensions_by_resource: Dict[Resource, List[Dict[str, str]]] = {}
+        self._resources_by_type: Dict[str, List[Resource]] = {}
+        for resource in self.monitored_resources:
+            self._resources_by_type.setdefault(resource.type, []).append(resource)
+        self._monitored_ec2 = frozenset(
+            resource.id for resource in self._resources_by_type.get("EC2", [])
+        )
+        # The three lookups hit independent APIs and fill separate attributes,
+        # so they run concurrently rather than paying each round trip in turn
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            rds_storage_map = executor.submit(self._get_rds_storage_map)
+            existing_alarms = executor.submit(self._load_existing_alarms)
+            cwagent_metrics = executor.submit(self._fetch_cwagent_metrics)
+        self._rds_storage_map = rds_storage_map.result()
+        existing_alarms.result()
+        cwagent_metrics.result()
+
+    def _load_existing_alarms(self) -> None:
+        if not (self._use_cache and self._load_cached_existing_alarms()):
+            self._scan_existing_alarms()
 
     #### Public Interface Methods ####
-    def deploy_alarms(self, alarms: Alarms) -> None:
-        """Deploy alarms in parallel batches."""
-        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
-            futures = {
-                executor.submit(
-                    self._deploy_single_alarm, self.aws_session, alarm
-                ): alarm.name
-                for alarm in alarms.alarms
-            }
-
-            for future in as_completed(futures):
-                alarm_name = futures[future]
-                try:
-                    future.result()
-                    logger.info(f"Deployed alarm: {alarm_name}")
-                except Exception as e:
-                    logger.error(f"Failed to deploy {alarm_name}: {e}")
-                    raise
+    def deploy_alarms(self, alarms: Union[Alarms, Iterable[AlarmConfig]]) -> int:
+        """
+        Deploy alarms in parallel, paced to the PutMetricAlarm rate limit.
+        Accepts an Alarms collection or a stream such as iter_alarm_definitions(),
+        consumed as deployments complete so at most DEPLOY_MAX_IN_FLIGHT alarms
+        are pending. Alarms sharing a name are deployed once, as PutMetricAlarm
+        upserts by name. A failed alarm does not stop the others; once all are
+        attempted, RuntimeError naming the failed alarms is raised.
+        Returns the number of alarms deployed.
+        """
+        alarm_stream = alarms.alarms if isinstance(alarms, Alarms) else alarms
+        seen_names = set()
+
+        def unique_alarms() -> Iterator[AlarmConfig]:
+            for alarm in alarm_stream:
+                if alarm.name not in seen_names:
+                    seen_names.add(alarm.name)
+                    yield alarm
+
+        pending_alarms = unique_alarms()
+        deployed_count = 0
+        failed_names: List[str] = []
+        try:
+            with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+                in_flight = {}
+                while True:
+                    for alarm in pending_alarms:
+                        future = executor.submit(
+                            self._deploy_single_alarm, self._cw_client, alarm
+                        )
+                        in_flight[future] = alarm
+                        if len(in_flight) >= DEPLOY_MAX_IN_FLIGHT:
+                            break
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        alarm = in_flight.pop(future)
+                        if future.exception() is None:
+                            deployed_count += 1
+                            self._existing_alarms.add(alarm.name)
+                            logger.debug("Deployed alarm: %s", alarm.name)
+                        else:
+                            failed_names.append(alarm.name)
+        finally:
+            self._save_existing_alarms_cache()
+
+        logger.info("Deployed %d/%d alarms", deployed_count, len(seen_names))
+        if failed_names:
+            raise RuntimeError(
+                f"Failed to deploy {len(failed_names)}/{len(seen_names)} alarms: "
+                f"{', '.join(sorted(failed_names))}"
+            )
+        return deployed_count
 
     def scan_alarms(self) -> None:
         """Scan and cache existing alarms in the AWS account."""
+        # Report live state, not the on-disk cache
+        if self._existing_alarms_from_cache:
+            self._scan_existing_alarms()
         logger.info(
-            f"Successfully scanned resources for landing zone: {self.landing_zone.name}"
+            "Successfully scanned resources for landing zone: %s",
+            self.landing_zone.name,
         )
-        logger.info(f"Existing alarms: {self._existing_alarms}")
+        logger.info("Existing alarms: %s", self._existing_alarms)
 
     def delete_alarms(self) -> None:
-        """Delete all alarms in the AWS account."""
-        logger.info(f"Deleting alarms for landing zone: {self.landing_zone.name}")
-        for alarm in self._existing_alarms:
-            self.aws_session.session.client("cloudwatch").delete_alarms(
-                AlarmNames=[alarm]
-            )
-            logger.info(f"Deleted alarm: {alarm}")
+        """
+        Delete this landing zone's CMS-managed alarms. Alarms sharing the name
+        prefix without the managed_by=CMS tag are left alone.
+        The names always come from a live scan, never the on-disk cache.
+        """
+        logger.info("Deleting alarms for landing zone: %s", self.landing_zone.name)
+        self._refresh_existing_alarms()
+        alarm_names = sorted(self._existing_alarms)
+        deleted_count = 0
+        try:
+            # DeleteAlarms accepts up to DELETE_ALARMS_BATCH_SIZE names per call
+            for start in range(0, len(alarm_names), DELETE_ALARMS_BATCH_SIZE):
+                batch = alarm_names[start : start + DELETE_ALARMS_BATCH_SIZE]
+                self._cw_client.delete_alarms(AlarmNames=batch)
+                self._existing_alarms.difference_update(batch)
+                deleted_count += len(batch)
+                logger.debug("Deleted alarms: %s", batch)
+        finally:
+            self._save_existing_alarms_cache()
+        logger.info("Deleted %d alarms", deleted_count)
 
     def create_all_alarm_definitions(self) -> Alarms:
         """Create alarm definitions for all resources."""
-        try:
-            all_alarm_definitions = Alarms()
-            with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
-                futures = {
-                    executor.submit(self._create_alarm_definitions, resource): resource
-                    for resource in self.monitored_resources
-                }
-
-                for future in as_completed(futures):
-                    resource = futures[future]
-                    try:
-                        alarms = future.result()
-                        all_alarm_definitions.add_alarm(alarms)
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create alarm definitions for {resource.name}: {e}"
-                        )
+        all_alarm_definitions = Alarms()
+        for alarm in self.iter_alarm_definitions():
+            all_alarm_definitions.add_alarm(alarm)
+        return all_alarm_definitions
 
-            return all_alarm_definitions
-        except Exception as e:
-            logger.error(f"Failed to create all alarm definitions: {e}")
-            return Alarms()
+    def iter_alarm_definitions(self) -> Iterator[AlarmConfig]:
+        """
+        Yield alarm definitions resource by resource, so deployment can start
+        before every definition is built.
+        Building definitions is pure CPU work on data fetched up front, so it
+        runs serially; threads are reserved for the AWS API calls.
+        """
+        resources = []
+        for resource_type, typed_resources in self._resources_by_type.items():
+            if self._alarm_configs.get(resource_type):
+                resources.extend(typed_resources)
+            else:
+                logger.debug(
+                    "Skipping %d %s resources with no alarm configs",
+                    len(typed_resources),
+                    resource_type,
+                )
+
+        created_count = 0
+        for resource in resources:
+            try:
+                alarm_definitions = self._create_alarm_definitions(resource)
+            except Exception as e:
+                logger.error(
+                    "Failed to create alarm definitions for %s: %s", resource.name, e
+                )
+                continue
+            created_count += len(alarm_definitions)
+            yield from alarm_definitions.alarms
+
+        logger.info(
+            "Created %d alarm definitions for %d resources",
+            created_count,
+            len(resources),
+        )
 
     #### Alarm Definition Creation Methods ####
     def _create_alarm_definitions(self, resource: Resource) -> Alarms:
@@ -144,12 +325,31 @@ class AlarmManager:
         alarm_configs = self._get_alarm_config_by_resource_type(resource.type)
 
         if not alarm_configs:
-            logger.debug(f"No alarm configs found for resource type: {resource.type}")
+            logger.debug("No alarm configs found for resource type: %s", resource.type)
             return alarm_definitions
 
-        for alarm_config in alarm_configs:
+        # Name every enabled alarm up front, then only build the ones missing
+        # from CloudWatch; in steady state most names are already deployed
+        alarm_name_prefix = f"{self._alarm_name_prefix}{resource.type}-{resource.name}-"
+        desired = {
+            alarm_name_prefix + suffix: alarm_config
+            for suffix, alarm_config in self._enabled_alarm_configs[resource.type]
+        }
+        missing = desired.keys() - self._existing_alarms
+        logger.debug(
+            "%d/%d alarms already exist for %s",
+            len(desired) - len(missing),
+            len(desired),
+            resource.name,
+        )
+
+        for alarm_name, alarm_config in desired.items():
+            if alarm_name not in missing:
+                continue
             try:
-                alarm_def = self._create_single_alarm_definition(alarm_config, resource)
+                alarm_def = self._create_single_alarm_definition(
+                    alarm_config, resource, alarm_name
+                )
                 if alarm_def:
                     if self._is_cwagent_namespace(alarm_config.metric.namespace):
                         # Only add CWAgent-specific alarms for CWAgent namespace
@@ -162,12 +362,15 @@ class AlarmManager:
 
             except Exception as e:
                 logger.error(
-                    f"Failed to create alarm definition for {resource.name}: {e}"
+                    "Failed to create alarm definition for %s: %s", resource.name, e
                 )
                 continue
 
-        logger.info(
-            f"Created {len(alarm_definitions)} alarm definitions for {resource.type} - {resource.name}"
+        logger.debug(
+            "Created %d alarm definitions for %s - %s",
+            len(alarm_definitions),
+            resource.type,
+            resource.name,
         )
         return alarm_definitions
 
@@ -176,12 +379,11 @@ class AlarmManager:
     ) -> Alarms:
         """Create multiple alarm definitions for cwagent metrics."""
         cwagent_alarm_definitions = Alarms()
-        logger.info(f"Creating CWAgent alarm definitions for resource: {resource.id}")
+        logger.debug("Creating CWAgent alarm definitions for resource: %s", resource.id)
 
         try:
-            cwagent_metrics = (
-                self._cwagent_metrics.get_metrics(resource.id, alarm_def.metric.name)
-                or []
+            cwagent_metrics = self._cwagent_metrics.get_metrics(
+                resource.id, alarm_def.metric.name
             )
 
             for metric in cwagent_metrics:
@@ -194,109 +396,95 @@ class AlarmManager:
                         )
 
                     # Create base alarm name without redundant information
-                    new_alarm_def = deepcopy(alarm_def)
-                    new_alarm_def.name = f"{alarm_def.name}-{distinct_value}"
+                    alarm_name = f"{alarm_def.name}-{distinct_value}"
 
-                    if self._is_alarm_exists(new_alarm_def.name):
-                        logger.info(
-                            f"Alarm {new_alarm_def.name} already exists, skipping creation"
+                    if self._is_alarm_exists(alarm_name):
+                        logger.debug(
+                            "Alarm %s already exists, skipping creation", alarm_name
                         )
                         continue
 
-                    new_alarm_def.metric.dimensions = metric.dimensions
+                    new_alarm_def = replace(
+                        alarm_def,
+                        name=alarm_name,
+                        metric=replace(alarm_def.metric, dimensions=metric.dimensions),
+                    )
                     cwagent_alarm_definitions.add_alarm(new_alarm_def)
 
                 except Exception as e:
                     logger.error(
-                        f"Failed to create alarm definition for metric {metric}: {e}"
+                        "Failed to create alarm definition for metric %s: %s", metric, e
                     )
                     continue
 
         except Exception as e:
             logger.error(
-                f"Failed to create CWAgent alarm definitions for resource {resource.id}: {e}"
+                "Failed to create CWAgent alarm definitions for resource %s: %s",
+                resource.id,
+                e,
             )
 
         return cwagent_alarm_definitions
 
     def _create_single_alarm_definition(
-        self, alarm: AlarmConfig, resource: Resource
+        self, alarm: AlarmConfig, resource: Resource, alarm_name: str
     ) -> Optional[AlarmConfig]:
-        alarm_name = f"{self.landing_zone.name}-{resource.type}-{resource.name}-{alarm.metric_name()}"
-
-        if self._is_alarm_exists(alarm_name):
-            logger.info(f"Alarm {alarm_name} already exists, skipping creation")
-            return None
-
-        if self._is_disabled_alarm(resource.type, alarm.metric.name):
-            logger.info(f"Alarm {alarm_name} is disabled, skipping creation")
-            return None
-
         threshold = self._get_threshold_value(
             resource.type, alarm.metric.name, resource.id
         )
 
         if threshold is None:
             logger.warning(
-                f"Missing threshold config for {resource.type}.{alarm.metric.name}"
+                "Missing threshold config for %s.%s", resource.type, alarm.metric.name
             )
             return None
 
-        new_alarm = deepcopy(alarm)
-        new_alarm.name = alarm_name
-        new_alarm.description = f"Alarm for {alarm.metric.name} on {resource.name}"
-        new_alarm.metric.dimensions = self._get_dimensions(resource)
-        new_alarm.threshold_value = threshold
-        new_alarm.sns_topic_arns = self._get_sns_topics(
-            resource.type, alarm.metric.name
+        return replace(
+            alarm,
+            name=alarm_name,
+            description=f"Alarm for {alarm.metric.name} on {resource.name}",
+            metric=replace(alarm.metric, dimensions=self._get_dimensions(resource)),
+            threshold_value=threshold,
+            sns_topic_arns=self._get_sns_topics(resource.type, alarm.metric.name),
         )
 
-        return new_alarm
-
     #### Configuration Helper Methods ####
     def _get_alarm_config_by_resource_type(
         self, resource_type: str
-    ) -> List[AlarmConfig]:
-        return self._alarm_configs.get(resource_type, [])
+    ) -> Tuple[AlarmConfig, ...]:
+        return self._alarm_configs.get(resource_type, ())
 
     def _get_dimensions(self, resource: Resource) -> List[Dict[str, str]]:
-        """Get dimensions for a specific resource based on resource type."""
+        """
+        Get dimensions for a specific resource based on resource type.
+        Built once per resource and shared by its alarms, which only read them.
+        """
+        dimensions = self._dimensions_by_resource.get(resource)
+        if dimensions is not None:
+            return dimensions
+
         dimension_key = DIMENSION_KEYS.get(resource.type)
         if not dimension_key:
-            logger.warning(f"No dimension key found for resource type {resource.type}")
-            return []
-
-        dimensions = [{"Name": dimension_key, "Value": resource.id}]
+            logger.warning("No dimension key found for resource type %s", resource.type)
+            dimensions = []
+        else:
+            dimensions = [{"Name": dimension_key, "Value": resource.id}]
+        self._dimensions_by_resource[resource] = dimensions
         return dimensions
 
     def _get_sns_topics(self, resource_type: str, metric_name: str) -> List[str]:
         """Get SNS topic ARNs for the given resource type and metric."""
-        sns_prefix = f"arn:aws:sns:{DEFAULT_REGION}:{self.landing_zone.account_id}:"
-        sns_topic_arns = self._sns_topics
-
-        # Get custom topic configuration
-        custom_sns_mappings = (
-            self._custom_configs.get("sns_mappings", {})
-            .get(resource_type, {})
-            .get(metric_name, {})
+        return self._sns_topic_arns.get(
+            (resource_type, metric_name), self._default_sns_topic_arns
         )
 
-        if (
-            custom_sns_mappings
-            and self.landing_zone.category in custom_sns_mappings.get("categories", [])
-        ):
-            sns_topic_arns = custom_sns_mappings.get("sns_topics", self._sns_topics)
-
-        return [sns_prefix + topic for topic in sns_topic_arns]
-
     def _get_threshold_value(
         self, resource_type: str, metric_name: str, resource_id: str
     ) -> Optional[float]:
         """Get threshold value for a specific resource type and metric."""
-        resource_thresholds = self._threshold_configs.get(resource_type, {})
-        threshold = resource_thresholds.get(metric_name)
+        threshold = self._thresholds.get((resource_type, metric_name))
         if threshold is None:
-            logger.warning(f"No threshold found for {resource_type}.{metric_name}")
+            logger.warning("No threshold found for %s.%s", resource_type, metric_name)
             return None
 
         if resource_type == "RDS" and metric_name == "FreeStorageSpace":
@@ -310,20 +498,30 @@ class AlarmManager:
         Get a mapping of RDS instance IDs to their allocated storage in GiB.
         Returns a dictionary of {instance_id: allocated_storage}
         """
+        db_instance_ids = [r.id for r in self._resources_by_type.get("RDS", [])]
+        if not db_instance_ids:
+            return {}
+
         storage_map = {}
         try:
-            rds_client = self.aws_session.session.client("rds")
+            rds_client = self.aws_session.client("rds")
             paginator = rds_client.get_paginator("describe_db_instances")
 
-            for page in paginator.paginate():
-                for instance in page["DBInstances"]:
-                    storage_map[instance["DBInstanceIdentifier"]] = instance[
-                        "AllocatedStorage"
-                    ]
+            # Filter server-side to the monitored instances, in batches of the
+            # maximum number of values a DescribeDBInstances filter accepts
+            for start in range(0, len(db_instance_ids), RDS_FILTER_BATCH_SIZE):
+                batch = db_instance_ids[start : start + RDS_FILTER_BATCH_SIZE]
+                for page in paginator.paginate(
+                    Filters=[{"Name": "db-instance-id", "Values": batch}]
+                ):
+                    for instance in page["DBInstances"]:
+                        storage_map[instance["DBInstanceIdentifier"]] = instance[
+                            "AllocatedStorage"
+                        ]
 
             return storage_map
         except Exception as e:
-            logger.error(f"Failed to fetch RDS storage information: {e}")
+            logger.error("Failed to fetch RDS storage information: %s", e)
             return {}
 
     def _convert_rds_storage_threshold_to_bytes(
@@ -354,19 +552,21 @@ class AlarmManager:
             return threshold_bytes
         except Exception as e:
             logger.error(
-                f"Failed to convert threshold to bytes for RDS instance {resource_id}: {e}"
+                "Failed to convert threshold to bytes for RDS instance %s: %s",
+                resource_id,
+                e,
             )
             return DEFAULT_THRESHOLD_GB * 1024 * 1024 * 1024  # Convert 10GB to bytes
 
-    def _deploy_single_alarm(self, session: AWSSession, alarm: AlarmConfig) -> None:
-        """Deploy a single CloudWatch alarm."""
+    def _deploy_single_alarm(self, cloudwatch_client, alarm: AlarmConfig) -> None:
+        """Deploy a single CloudWatch alarm using a shared, thread-safe client."""
         if not alarm:
             logger.error("Cannot deploy alarm with no name")
             return
 
-        cloudwatch = session.session.client("cloudwatch")
+        self._put_alarm_rate_limiter.acquire()
         try:
-            cloudwatch.put_metric_alarm(
+            cloudwatch_client.put_metric_alarm(
                 AlarmName=alarm.name,
                 MetricName=alarm.metric.name,
                 Namespace=alarm.metric.namespace,
@@ -383,74 +583,236 @@ class AlarmManager:
                 Tags=self._build_alarm_tags(alarm.name),
             )
         except Exception as e:
-            logger.error(f"Error deploying alarm {alarm.name}: {e}")
+            logger.error("Error deploying alarm %s: %s", alarm.name, e)
             raise
 
     def _is_alarm_exists(self, alarm_name: str) -> bool:
         """Check if an alarm already exists."""
-        if not self._existing_alarms:
-            self._scan_existing_alarms()
         return alarm_name in self._existing_alarms
 
     def _is_disabled_alarm(self, resource_type: str, metric_name: str) -> bool:
         """Check if an alarm is disabled in custom configurations."""
-        disabled_alarms = self._custom_configs.get("disabled_alarms", {})
-        return metric_name in disabled_alarms.get(self.landing_zone.name, {}).get(
-            resource_type, []
-        )
+        return (resource_type, metric_name) in self._disabled_alarms
 
     def _scan_existing_alarms(self):
-        """Scan and cache existing alarms in the AWS account."""
-        resource_scanner = ResourceScanner(self.aws_session, DEFAULT_REGION)
-        if not self._existing_alarms:
-            scanned_alarms = resource_scanner.get_resources_by_tag(
-                tags={MANAGE_BY_TAG_KEY: CMS_MANAGED_TAG_VALUE},
-                resource_config={
-                    "CloudWatch": {"type": "cloudwatch:alarm", "delimiter": ":"}
-                },
+        """Scan and cache existing alarms for the landing zone."""
+        try:
+            self._refresh_existing_alarms()
+        except Exception as e:
+            logger.error("Failed to scan existing alarms: %s", e)
+
+    def _refresh_existing_alarms(self) -> None:
+        """Replace the existing alarms with a live scan; raises on failure."""
+        scanned_at = time.time()
+        self._existing_alarms = self._fetch_existing_alarms()
+        self._existing_alarms_scanned_at = scanned_at
+        self._existing_alarms_from_cache = False
+        self._save_existing_alarms_cache()
+
+    def _fetch_existing_alarms(self) -> Set[str]:
+        """
+        Names of this landing zone's alarms managed by CMS: named with the
+        landing zone prefix and tagged managed_by=CMS. Create, scan and delete
+        all work from this set, so an unmanaged alarm that shares a name is
+        never treated as one of ours. Raises if either lookup fails.
+        """
+        # The name prefix filters server-side without fetching tags
+        paginator = self._cw_client.get_paginator("describe_alarms")
+        pages = paginator.paginate(
+            AlarmNamePrefix=self._alarm_name_prefix,
+            PaginationConfig={"PageSize": 100},
+        )
+        prefixed_alarms = {
+            alarm["AlarmName"]
+            for page in pages
+            for alarm in page.get("MetricAlarms", [])
+        }
+        if not prefixed_alarms:
+            return prefixed_alarms
+        return prefixed_alarms & self._fetch_managed_alarms()
+
+    def _fetch_managed_alarms(self) -> Set[str]:
+        """Names of the alarms tagged managed_by=CMS in the account."""
+        tagging_client = self.aws_session.client("resourcegroupstaggingapi")
+        paginator = tagging_client.get_paginator("get_resources")
+        pages = paginator.paginate(
+            TagFilters=[{"Key": MANAGE_BY_TAG_KEY, "Values": [CMS_MANAGED_TAG_VALUE]}],
+            ResourceTypeFilters=["cloudwatch:alarm"],
+            PaginationConfig={"PageSize": 100},
+        )
+        # arn:aws:cloudwatch:<region>:<account>:alarm:<name>; the name itself
+        # may contain colons (e.g. Windows disk alarms ending in "C:")
+        return {
+            item["ResourceARN"].split(":", 6)[6]
+            for page in pages
+            for item in page.get("ResourceTagMappingList", [])
+        }
+
+    def _load_cached_existing_alarms(self) -> bool:
+        """Load existing alarms from the on-disk cache if it is still fresh."""
+        try:
+            cache = _json_loads(self._existing_alarms_cache_path.read_bytes())
+            if time.time() - cache["timestamp"] > EXISTING_ALARMS_CACHE_TTL:
+                return False
+            self._existing_alarms = set(cache["alarms"])
+            self._existing_alarms_scanned_at = cache["timestamp"]
+            self._existing_alarms_from_cache = True
+            logger.debug(
+                "Loaded existing alarms from %s", self._existing_alarms_cache_path
+            )
+            return True
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable existing alarms cache: %s", e)
+            return False
+
+    def _save_existing_alarms_cache(self) -> None:
+        """
+        Persist the existing alarm names so later runs can skip the scan.
+        The timestamp stays that of the last scan, so updates made by deploy
+        and delete never extend the cache past EXISTING_ALARMS_CACHE_TTL.
+        """
+        if self._existing_alarms_scanned_at is None:
+            return
+        try:
+            self._existing_alarms_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._existing_alarms_cache_path.write_bytes(
+                _json_dumps(
+                    {
+                        "timestamp": self._existing_alarms_scanned_at,
+                        "alarms": sorted(self._existing_alarms),
+                    }
+                )
             )
-            self._existing_alarms = {alarm.name for alarm in scanned_alarms}
+        except OSError as e:
+            logger.warning("Failed to write existing alarms cache: %s", e)
 
     def _build_alarm_tags(self, alarm_name: str) -> List[Dict[str, str]]:
         """Create standardized tags for CloudWatch alarms."""
-        return [
-            {"Key": "Name", "Value": alarm_name},
-            {"Key": "AppID", "Value": self.landing_zone.app_id},
-            {"Key": "Environment", "Value": self.landing_zone.env},
-            {"Key": "ResourceType", "Value": "CloudWatchAlarm"},
-            {"Key": MANAGE_BY_TAG_KEY, "Value": CMS_MANAGED_TAG_VALUE},
-        ]
+        return [{"Key": "Name", "Value": alarm_name}, *self._constant_tags]
 
     def _is_cwagent_namespace(self, namespace: str) -> bool:
         return namespace == "CWAgent"
 
     def _fetch_cwagent_metrics(self) -> None:
         """Fetch and cache valid and existing CWAgent metrics from CloudWatch."""
-        for metric_name, distinct_dimension_key in CWAGENT_METRICS.items():
+        listed_metrics = (
+            self._load_cached_cwagent_metrics() if self._use_cache else None
+        )
+        if listed_metrics is None:
             try:
-                metrics = self._fetch_metric_in_namespace("CWAgent", metric_name)
-                for cwagent_metric in metrics:
-                    metric_config = MetricConfig(
-                        name=cwagent_metric.get("MetricName", ""),
-                        namespace=cwagent_metric.get("Namespace", ""),
-                        dimensions=cwagent_metric.get("Dimensions", []),
-                    )
-                    self._cwagent_metrics.add_metric(
-                        metric_config, self._monitored_ec2, distinct_dimension_key
-                    )
+                listed_metrics = [
+                    metric
+                    for metric in self._list_cwagent_metrics()
+                    if metric.get("MetricName", "") in CWAGENT_METRICS
+                ]
             except Exception as e:
-                logger.error(f"Failed to fetch cwagent metric {metric_name}: {e}")
+                logger.error("Failed to fetch CWAgent metrics: %s", e)
+                return
+            self._save_cwagent_metrics_cache(listed_metrics)
+
+        # Group by metric name so each batch shares one distinct dimension key
+        metrics_by_name: Dict[str, List[MetricConfig]] = {}
+        for cwagent_metric in listed_metrics:
+            metric_name = cwagent_metric["MetricName"]
+            # Listed metrics repeat a handful of names across every instance,
+            # so intern them rather than keep one string copy per row
+            dimensions = cwagent_metric.get("Dimensions", [])
+            for dimension in dimensions:
+                if "Name" in dimension:
+                    dimension["Name"] = sys.intern(dimension["Name"])
+            metrics_by_name.setdefault(metric_name, []).append(
+                MetricConfig(
+                    name=sys.intern(metric_name),
+                    namespace=sys.intern(cwagent_metric.get("Namespace", "")),
+                    dimensions=dimensions,
+                )
+            )
 
-    def _fetch_metric_in_namespace(
-        self, namespace: str, metric_name: str
-    ) -> List[Dict]:
-        """Fetch all metrics with specified name in a CloudWatch namespace."""
-        client = self.aws_session.session.client("cloudwatch")
+        for metric_name, metrics in metrics_by_name.items():
+            self._cwagent_metrics.add_metrics(
+                metrics, self._monitored_ec2, CWAGENT_METRICS[metric_name]
+            )
+
+    def _load_cached_cwagent_metrics(self) -> Optional[List[Dict]]:
+        """
+        Load listed CWAgent metrics from the on-disk cache if it is still fresh
+        and was built for the same set of monitored instances.
+        """
         try:
-            response = client.list_metrics(Namespace=namespace, MetricName=metric_name)
-            return response.get("Metrics", [])
-        except Exception as e:
-            logger.error(
-                f"Error fetching metric {metric_name} in namespace {namespace}: {e}"
+            cache = _json_loads(self._cwagent_metrics_cache_path.read_bytes())
+            if time.time() - cache["timestamp"] > CWAGENT_METRICS_CACHE_TTL:
+                return None
+            if set(cache["instances"]) != self._monitored_ec2:
+                return None
+            logger.debug(
+                "Loaded CWAgent metrics from %s", self._cwagent_metrics_cache_path
             )
+            return cache["metrics"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable CWAgent metrics cache: %s", e)
+            return None
+
+    def _save_cwagent_metrics_cache(self, metrics: List[Dict]) -> None:
+        """Persist listed CWAgent metrics so later runs can skip ListMetrics."""
+        try:
+            self._cwagent_metrics_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cwagent_metrics_cache_path.write_bytes(
+                _json_dumps(
+                    {
+                        "timestamp": time.time(),
+                        "instances": sorted(self._monitored_ec2),
+                        "metrics": metrics,
+                    }
+                )
+            )
+        except OSError as e:
+            logger.warning("Failed to write CWAgent metrics cache: %s", e)
+
+    def _list_cwagent_metrics(self) -> Iterable[Dict]:
+        """
+        List CWAgent metrics for the monitored EC2 instances.
+        Small fleets are filtered by InstanceId server-side, one listing per
+        instance; larger fleets fall back to a single listing of the namespace,
+        streamed page by page.
+        """
+        if not self._monitored_ec2:
             return []
+
+        if len(self._monitored_ec2) >= CWAGENT_INSTANCE_FILTER_THRESHOLD:
+            return self._fetch_metric_in_namespace("CWAgent")
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda instance_id: list(
+                    self._fetch_metric_in_namespace(
+                        "CWAgent",
+                        dimensions=[{"Name": "InstanceId", "Value": instance_id}],
+                    )
+                ),
+                self._monitored_ec2,
+            )
+            return [metric for metrics in results for metric in metrics]
+
+    def _fetch_metric_in_namespace(
+        self,
+        namespace: str,
+        metric_name: Optional[str] = None,
+        dimensions: Optional[List[Dict[str, str]]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Yield all metrics in a CloudWatch namespace, following pagination, so
+        only one page of the listing is held at a time. Errors propagate, so a
+        partial listing is never cached.
+        """
+        request = {"Namespace": namespace}
+        if metric_name:
+            request["MetricName"] = metric_name
+        if dimensions:
+            request["Dimensions"] = dimensions
+        paginator = self._cw_client.get_paginator("list_metrics")
+        for page in paginator.paginate(**request):
+            yield from page.get("Metrics", [])
@@ -1,23 +1,46 @@
 """AWS-specific constants for CloudWatch alarm management."""
 
-from typing import Final, Dict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final, Mapping
 
 # AWS CloudWatch Constants
 DEFAULT_REGION: Final[str] = "ap-southeast-1"
 DEFAULT_MAX_WORKERS: Final[int] = 5
+# Default CloudWatch PutMetricAlarm quota per account/region
+PUT_METRIC_ALARM_TPS: Final[int] = 3
+# Maximum alarm names accepted by a single DeleteAlarms call
+DELETE_ALARMS_BATCH_SIZE: Final[int] = 100
+# Maximum values in a DescribeDBInstances db-instance-id filter
+RDS_FILTER_BATCH_SIZE: Final[int] = 100
+# Deployments submitted to the thread pool but not yet finished
+DEPLOY_MAX_IN_FLIGHT: Final[int] = 2 * DEFAULT_MAX_WORKERS
+# Below this many EC2 instances, CWAgent metrics are listed per InstanceId
+CWAGENT_INSTANCE_FILTER_THRESHOLD: Final[int] = 20
 MANAGE_BY_TAG_KEY: Final[str] = "managed_by"
 CMS_MANAGED_TAG_VALUE: Final[str] = "CMS"
 
+# Local cache of existing CMS-managed alarms per account/region
+EXISTING_ALARMS_CACHE_DIR: Final[Path] = Path.home() / ".cache" / "monitoring_aws"
+EXISTING_ALARMS_CACHE_TTL: Final[int] = 300  # seconds
+# Listed CWAgent metrics only change when agents or disks change, so they
+# are cached alongside the alarms for longer
+CWAGENT_METRICS_CACHE_TTL: Final[int] = 3600  # seconds
+
 # Dimension keys for native metrics
-DIMENSION_KEYS: Final[Dict[str, str]] = {
-    "EC2": "InstanceId",
-    "RDS": "DBInstanceIdentifier",
-}
+DIMENSION_KEYS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "EC2": "InstanceId",
+        "RDS": "DBInstanceIdentifier",
+    }
+)
 
 # CWAgent metrics : distinct dimensions keys
-CWAGENT_METRICS: Final[Dict[str, str]] = {
-    "mem_used_percent": "",
-    "Memory % Committed Bytes In Use": "objectname",
-    "disk_used_percent": "path",
-    "LogicalDisk % Free Space": "instance",
-}
+CWAGENT_METRICS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "mem_used_percent": "",
+        "Memory % Committed Bytes In Use": "objectname",
+        "disk_used_percent": "path",
+        "LogicalDisk % Free Space": "instance",
+    }
+)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, Iterable, List, Optional, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricConfig:
     """Settings for a CloudWatch metric"""
 
@@ -20,47 +20,68 @@ class CWAgentMetrics:
     def __init__(self) -> None:
         # First key: InstanceId, Second key: metric_name
         self.metrics: Dict[str, Dict[str, List[MetricConfig]]] = {}
+        # (InstanceId, metric_name, distinct dimension value) already added
+        self._metric_keys: Set[Tuple[str, str, str]] = set()
 
     def add_metric(
         self,
         metric: MetricConfig,
-        instance_ids: set[str],
+        instance_ids: AbstractSet[str],
         distinct_dimension_key: str,
     ) -> bool:
         """Add a metric configuration for a resource"""
-        try:
-            dimensions = {d["Name"]: d["Value"] for d in metric.dimensions}
-        except (KeyError, TypeError):
-            return False
+        return self.add_metrics([metric], instance_ids, distinct_dimension_key) == 1
+
+    def add_metrics(
+        self,
+        metrics: Iterable[MetricConfig],
+        instance_ids: AbstractSet[str],
+        distinct_dimension_key: str,
+    ) -> int:
+        """
+        Add metrics sharing one distinct dimension key. Metrics whose InstanceId
+        is not in instance_ids, or that lack the distinct dimension, are skipped,
+        as are repeats of an already added (instance, metric, distinct value):
+        they would map to the same alarm name.
+        Returns the number of metrics added.
+        """
+        setdefault = self.metrics.setdefault
+        metric_keys = self._metric_keys
+        added = 0
+        for metric in metrics:
+            dimensions = {}
+            try:
+                for d in metric.dimensions:
+                    dimensions[d["Name"]] = d["Value"]
+            except (KeyError, TypeError):
+                continue
 
-        if not dimensions or "InstanceId" not in dimensions:
-            return False
+            instance_id = dimensions.get("InstanceId")
+            if instance_id not in instance_ids:
+                continue
 
-        if distinct_dimension_key:
-            if distinct_dimension_key not in dimensions:
-                return False
-            distinct_dimension_value = dimensions[distinct_dimension_key]
-            metric.distinct_dimension = {
-                distinct_dimension_key: distinct_dimension_value
-            }
+            distinct_value = ""
+            if distinct_dimension_key:
+                if distinct_dimension_key not in dimensions:
+                    continue
+                distinct_value = dimensions[distinct_dimension_key]
 
-        instance_id = dimensions["InstanceId"]
-        if instance_id not in instance_ids:
-            return False
+            metric_key = (instance_id, metric.name, distinct_value)
+            if metric_key in metric_keys:
+                continue
+            metric_keys.add(metric_key)
+            if distinct_dimension_key:
+                metric.distinct_dimension = {distinct_dimension_key: distinct_value}
 
-        metric_list = self.metrics.setdefault(instance_id, {}).setdefault(
-            metric.name, []
-        )
-        metric_list.append(metric)
-        return True
+            setdefault(instance_id, {}).setdefault(metric.name, []).append(metric)
+            added += 1
+        return added
 
     def get_instance_metrics(self, instance_id: str) -> Dict[str, List[MetricConfig]]:
         return self.metrics.get(instance_id, {})
 
-    def get_metrics(
-        self, instance_id: str, metric_name: str
-    ) -> Optional[List[MetricConfig]]:
-        return self.metrics.get(instance_id, {}).get(metric_name, None)
+    def get_metrics(self, instance_id: str, metric_name: str) -> List[MetricConfig]:
+        return self.metrics.get(instance_id, {}).get(metric_name, [])
 
     def __bool__(self) -> bool:
         return bool(self.metrics)
@@ -0,0 +1,21 @@
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly at a fixed rate per second."""
+
+    def __init__(self, calls_per_second: float) -> None:
+        self._interval = 1.0 / calls_per_second
+        self._next_slot = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller is allowed to make the next call."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(self._next_slot, now) + self._interval
+
+        if wait > 0:
+            time.sleep(wait)
@@ -1,13 +1,21 @@
 import argparse
 import logging
+import re
 from typing import NamedTuple
 
+from constants import DEFAULT_LZ_WORKERS
+
+# Contains "prod" but neither "nonprod" nor "preprod", in one pass
+_PRODUCTION_LZ_RE = re.compile(r"^(?!.*(?:nonprod|preprod)).*prod", re.I | re.S)
+
 
 class CliArgs(NamedTuple):
     lz: str
     action: str
     dry_run: bool
     change_request: str | None
+    max_workers: int
+    no_cache: bool
 
 
 class CliParser:
@@ -42,23 +50,32 @@ class CliParser:
             type=str,
             help="Change request number for logging (required for production landing zones)",
         )
+        parser.add_argument(
+            "--max-workers",
+            "-w",
+            type=int,
+            default=DEFAULT_LZ_WORKERS,
+            help=f"Landing zones processed in parallel (default: {DEFAULT_LZ_WORKERS})",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Ignore the on-disk caches of existing alarms and CWAgent metrics",
+        )
         args = parser.parse_args()
         return CliArgs(
             lz=args.landing_zone,
             action=args.action,
             dry_run=args.dry_run,
             change_request=args.change_request,
+            max_workers=args.max_workers,
+            no_cache=args.no_cache,
         )
 
     @staticmethod
     def is_production_lz(lz_name: str) -> bool:
         """Check if the landing zone is a production environment."""
-        lz_name_lower = lz_name.lower()
-        return (
-            "prod" in lz_name_lower
-            and "nonprod" not in lz_name_lower
-            and "preprod" not in lz_name_lower
-        )
+        return _PRODUCTION_LZ_RE.search(lz_name) is not None
 
     @staticmethod
     def validate_production_lz(args: CliArgs, logger: logging.Logger) -> None:
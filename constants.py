@@ -13,6 +13,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # AWS
 DEFAULT_REGION = "ap-southeast-1"
+# Landing zones processed concurrently; each one makes its own AWS calls
+DEFAULT_LZ_WORKERS: Final[int] = 16
 CMS_SPOKE_ROLE: Final[str] = "HIPCMSProvisionSpokeRole"
 # CMS_HUB_ROLE: Final[str] = ""
 
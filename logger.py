@@ -1,6 +1,4 @@
 import logging
-from pathlib import Path
-from typing import Dict
 
 
 class LoggerSetup:
@@ -1,13 +1,8 @@
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
-from aws_manager import (
-    LandingZoneManager,
-    SessionManager,
-    ResourceScanner,
-    AlarmManager,
-)
 from constants import (
     LZ_CONFIG,
     ALARM_SETTINGS,
@@ -20,10 +15,14 @@ from constants import (
 )
 from cli_parser import CliParser
 from logger import LoggerSetup
-from utils import validate_config_paths
+
+# aws_manager (and yaml through utils) is imported where it is first used, so
+# argument parsing and --help don't pay for loading it
+if TYPE_CHECKING:
+    from aws_manager import AlarmManager, LandingZoneManager
 
 # Config Paths
-BASE_DIR = Path(__file__).parent
+BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATHS = {
     "lz": BASE_DIR / LZ_CONFIG,
     "alarm_settings": BASE_DIR / ALARM_SETTINGS,
@@ -32,8 +31,10 @@ CONFIG_PATHS = {
 }
 
 
-def load_lz_config(logger: logging.Logger) -> LandingZoneManager:
+def load_lz_config(logger: logging.Logger) -> "LandingZoneManager":
     """Setup logging and load configurations."""
+    from aws_manager import LandingZoneManager
+    from utils import validate_config_paths
 
     if not validate_config_paths(CONFIG_PATHS, logger):
         raise FileNotFoundError("Landing zone configuration file not found")
@@ -41,10 +42,31 @@ def load_lz_config(logger: logging.Logger) -> LandingZoneManager:
     return LandingZoneManager(CONFIG_PATHS["lz"])
 
 
+def preload_alarm_configs() -> None:
+    """
+    Parse the alarm config files once before landing zones run in parallel,
+    so every AlarmManager reuses the cached configs instead of racing to load.
+    """
+    from aws_manager import AlarmConfigManager
+
+    AlarmConfigManager().load_configs(
+        CONFIG_PATHS["alarm_settings"],
+        CONFIG_PATHS["category_configs"],
+        CONFIG_PATHS["custom_settings"],
+    )
+
+
 def process_landing_zone(lz, args, logger: logging.Logger) -> None:
     """Process a single landing zone based on the provided arguments."""
-    logger.info(f"Processing landing zone: {lz}")
+    from aws_manager import SessionManager, ResourceScanner, AlarmManager
+
+    logger.info("Processing landing zone: %s", lz)
     try:
+        # Only a create dry run needs AWS data; the others just report
+        if args.dry_run and args.action != "create":
+            dry_run(None, logger, lz, args.action)
+            return
+
         session = SessionManager.get_or_create_session(
             lz=lz,
             role=CMS_SPOKE_ROLE,
@@ -53,12 +75,12 @@ def process_landing_zone(lz, args, logger: logging.Logger) -> None:
         )
 
         if not session:
-            logger.warning(f"Failed to create session for landing zone: {lz}")
+            logger.warning("Failed to create session for landing zone: %s", lz)
             return
 
         resource_scanner = ResourceScanner(session, DEFAULT_REGION)
         resources = resource_scanner.get_managed_resources(lz.env)
-        logger.info(f"Found {len(resources)} resources to monitor")
+        logger.info("Found %d resources to monitor", len(resources))
 
         alarm_manager = AlarmManager(
             landing_zone=lz,
@@ -67,71 +89,70 @@ def process_landing_zone(lz, args, logger: logging.Logger) -> None:
             alarm_config_path=CONFIG_PATHS["alarm_settings"],
             category_config_path=CONFIG_PATHS["category_configs"],
             custom_config_path=CONFIG_PATHS["custom_settings"],
+            use_cache=not args.no_cache,
         )
 
-        # Map actions to their corresponding methods
-        action_methods = {
-            "create": create_alarms,
-            "scan": scan_resources,
-            "delete": delete_alarms,
-        }
-
         # Handle dry run or execute the actual action
         if args.dry_run:
             dry_run(alarm_manager, logger, lz, args.action)
-        else:
-            action_method = action_methods.get(args.action)
-            if action_method:
-                action_method(alarm_manager, logger, lz)
-            else:
-                logger.error(f"Unknown action: {args.action}")
+            return
 
-    except Exception as e:
-        logger.error(f"Error processing landing zone {lz}: {e}")
+        match args.action:
+            case "create":
+                create_alarms(alarm_manager, logger, lz)
+            case "scan":
+                scan_resources(alarm_manager, logger, lz)
+            case "delete":
+                delete_alarms(alarm_manager, logger, lz)
+            case _:
+                logger.error("Unknown action: %s", args.action)
+
+    except Exception:
+        logger.exception("Error processing landing zone %s", lz)
 
 
 def create_alarms(alarm_manager, logger, lz):
     """Create and deploy alarms for the landing zone."""
-    alarm_definitions = alarm_manager.create_all_alarm_definitions()
-    logger.info(f"Created {len(alarm_definitions)} alarm definitions")
-    alarm_manager.deploy_alarms(alarm_definitions)
-    logger.info(f"Successfully deployed alarms for landing zone: {lz}")
+    # Definitions are streamed into deployment as they are built
+    deployed_count = alarm_manager.deploy_alarms(alarm_manager.iter_alarm_definitions())
+    logger.info("Created and deployed %d alarm definitions", deployed_count)
+    logger.info("Successfully deployed alarms for landing zone: %s", lz)
 
 
 def scan_resources(alarm_manager, logger, lz):
     """Scan resources for the landing zone."""
-    logger.info(f"Scanning resources for landing zone: {lz}")
+    logger.info("Scanning resources for landing zone: %s", lz)
     alarm_manager.scan_alarms()
-    logger.info(f"Successfully scanned resources for landing zone: {lz}")
+    logger.info("Successfully scanned resources for landing zone: %s", lz)
 
 
 def delete_alarms(alarm_manager, logger, lz):
     """Delete alarms for the landing zone."""
-    logger.info(f"Deleting alarms for landing zone: {lz}")
+    logger.info("Deleting alarms for landing zone: %s", lz)
     alarm_manager.delete_alarms()
-    logger.info(f"Successfully deleted alarms for landing zone: {lz}")
+    logger.info("Successfully deleted alarms for landing zone: %s", lz)
 
 
-def dry_run(alarm_manager, logger, lz, action):
+def dry_run(alarm_manager: Optional["AlarmManager"], logger, lz, action):
     """Simulate the execution of the specified action."""
-    logger.info(f"[DRY RUN] Simulating '{action}' for landing zone: {lz}")
+    logger.info("[DRY RUN] Simulating '%s' for landing zone: %s", action, lz)
 
     if action == "create":
         alarm_definitions = alarm_manager.create_all_alarm_definitions()
         logger.info(
-            f"[DRY RUN] Would create {len(alarm_definitions)} alarm definitions"
+            "[DRY RUN] Would create %d alarm definitions", len(alarm_definitions)
         )
         # Log sample of what would be created
-        for alarm in alarm_definitions[:3]:  # Show first 3 as example
-            logger.info(f"[DRY RUN] Would create alarm: {alarm}")
+        for alarm in alarm_definitions.alarms[:3]:  # Show first 3 as example
+            logger.info("[DRY RUN] Would create alarm: %s", alarm)
 
     elif action == "delete":
-        logger.info(f"[DRY RUN] Would delete all alarms for landing zone: {lz}")
+        logger.info("[DRY RUN] Would delete all alarms for landing zone: %s", lz)
 
     elif action == "scan":
-        logger.info(f"[DRY RUN] Would scan resources for landing zone: {lz}")
+        logger.info("[DRY RUN] Would scan resources for landing zone: %s", lz)
 
-    logger.info(f"[DRY RUN] Completed simulation for landing zone: {lz}")
+    logger.info("[DRY RUN] Completed simulation for landing zone: %s", lz)
 
 
 def main() -> None:
@@ -143,25 +164,35 @@ def main() -> None:
     logger = LoggerSetup(LOG_FORMAT).get_logger()
     try:
         logger.info(
-            f"Starting CMS Monitoring for landing zone: {args.lz} with action: {args.action}"
+            "Starting CMS Monitoring for landing zone: %s with action: %s",
+            args.lz,
+            args.action,
         )
 
         CliParser.validate_production_lz(args, logger)
 
         landing_zone_manager = load_lz_config(logger)
+        preload_alarm_configs()
 
         if args.lz.lower() == "all":
             landing_zones = landing_zone_manager.get_all_landing_zones()
         else:
             landing_zones = [landing_zone_manager.get_landing_zone(args.lz)]
 
-        for lz in landing_zones:
-            process_landing_zone(lz, args, logger)
+        # Landing zones are independent accounts and the work is AWS I/O bound
+        max_workers = max(1, min(args.max_workers, len(landing_zones)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_landing_zone, lz, args, logger): lz
+                for lz in landing_zones
+            }
+            for future in as_completed(futures):
+                future.result()
 
         logger.info("CMS Monitoring completed successfully")
 
     except Exception as e:
-        logger.error(f"Fatal error in main execution: {e}")
+        logger.error("Fatal error in main execution: %s", e)
         raise
 
 
@@ -0,0 +1,131 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aws_manager.core import LandingZone, Resource
+from aws_manager.monitoring import alarm_manager
+from aws_manager.monitoring.alarm_config import AlarmConfig
+from aws_manager.monitoring.alarm_manager import AlarmManager
+from aws_manager.monitoring.metric_config import MetricConfig
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "configs"
+LANDING_ZONE = LandingZone(
+    name="lz1nonprod",
+    env="nonprod",
+    account_id="111111111111",
+    app_id="CMS",
+    category="CAT_B",
+)
+EXISTING_ALARM = "lz1nonprod-EC2-web-StatusCheckFailed"
+
+
+class FakePaginator:
+    def __init__(self, pages):
+        self._pages = pages
+
+    def paginate(self, **kwargs):
+        return iter(self._pages)
+
+
+class FakeCloudWatchClient:
+    """Fails PutMetricAlarm for the alarm names in fail_names."""
+
+    def __init__(self, fail_names):
+        self.fail_names = set(fail_names)
+        self.put_names = []
+
+    def get_paginator(self, operation_name):
+        if operation_name == "describe_alarms":
+            return FakePaginator([{"MetricAlarms": [{"AlarmName": EXISTING_ALARM}]}])
+        return FakePaginator([{"Metrics": []}])
+
+    def put_metric_alarm(self, AlarmName, **kwargs):
+        if AlarmName in self.fail_names:
+            raise RuntimeError("throttled")
+        self.put_names.append(AlarmName)
+
+
+class FakeTaggingClient:
+    def get_paginator(self, operation_name):
+        arn = f"arn:aws:cloudwatch:ap-southeast-1:111111111111:alarm:{EXISTING_ALARM}"
+        return FakePaginator([{"ResourceTagMappingList": [{"ResourceARN": arn}]}])
+
+
+class FakeSession:
+    def __init__(self, clients):
+        self._clients = clients
+
+    def client(self, service_name, region_name=None):
+        return self._clients[service_name]
+
+
+def make_alarm(name):
+    return AlarmConfig(
+        metric=MetricConfig(
+            name="CPUUtilization",
+            namespace="AWS/EC2",
+            dimensions=[{"Name": "InstanceId", "Value": "i-1"}],
+        ),
+        statistic="Average",
+        comparison_operator="GreaterThanThreshold",
+        unit="Percent",
+        period=300,
+        evaluation_periods=2,
+        threshold_value=80,
+        name=name,
+    )
+
+
+class DeployAlarmsTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.object(
+            alarm_manager, "EXISTING_ALARMS_CACHE_DIR", Path(cache_dir.name)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cw_client = FakeCloudWatchClient(fail_names={"lz1nonprod-EC2-b-CPU"})
+        session = FakeSession(
+            {
+                "cloudwatch": self.cw_client,
+                "resourcegroupstaggingapi": FakeTaggingClient(),
+            }
+        )
+        self.manager = AlarmManager(
+            landing_zone=LANDING_ZONE,
+            aws_session=session,
+            monitored_resources=[Resource(type="EC2", name="web", id="i-1")],
+            alarm_config_path=CONFIG_DIR / "alarm_settings.yml",
+            category_config_path=CONFIG_DIR / "category_configs.yml",
+            custom_config_path=CONFIG_DIR / "custom_settings.yml",
+        )
+
+    def test_failed_alarm_does_not_stop_the_others(self):
+        alarms = [
+            make_alarm("lz1nonprod-EC2-a-CPU"),
+            make_alarm("lz1nonprod-EC2-b-CPU"),
+            make_alarm("lz1nonprod-EC2-c-CPU"),
+        ]
+
+        with self.assertRaises(RuntimeError) as raised:
+            self.manager.deploy_alarms(alarms)
+
+        self.assertIn("1/3", str(raised.exception))
+        self.assertIn("lz1nonprod-EC2-b-CPU", str(raised.exception))
+        self.assertCountEqual(
+            self.cw_client.put_names, ["lz1nonprod-EC2-a-CPU", "lz1nonprod-EC2-c-CPU"]
+        )
+
+        cache = json.loads(self.manager._existing_alarms_cache_path.read_text())
+        self.assertCountEqual(
+            cache["alarms"],
+            [EXISTING_ALARM, "lz1nonprod-EC2-a-CPU", "lz1nonprod-EC2-c-CPU"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
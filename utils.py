@@ -1,21 +1,53 @@
+import os
+import logging
 from logging import Logger
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Set, Tuple, Union
 
 import yaml
 
+try:
+    # libyaml C bindings parse several times faster than the pure Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Parsed YAML kept for the life of the process, keyed by (path, mtime, size).
+# Callers only read the returned data, so it is shared rather than copied.
+_yaml_cache: Dict[Tuple[str, int, int], Dict] = {}
+
 
 def load_yaml(file_path: Union[str, Path]) -> Dict:
-    with open(file_path, "r") as file:
-        data = yaml.safe_load(file)
+    """Load a YAML file, reusing the parsed data while its mtime and size are unchanged."""
+    path = Path(file_path)
+    stat = path.stat()
+    cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if cache_key in _yaml_cache:
+        return _yaml_cache[cache_key]
+
+    with open(path, "rb") as file:
+        data = yaml.load(file, Loader=YamlLoader)
+    _yaml_cache[cache_key] = data
     return data
 
 
 def validate_config_paths(config_paths: Dict[str, Path], logger: Logger) -> bool:
-    """Validate that all configuration paths exist."""
+    """
+    Validate that all configuration paths exist. Each directory is listed
+    once, rather than stat-ing every config file on its own.
+    """
+    entries_by_dir: Dict[Path, Set[str]] = {}
     for config_name, path in config_paths.items():
-        if not path.exists():
-            logger.error(f"Configuration file not found: {config_name} at {path}")
+        if path.parent not in entries_by_dir:
+            try:
+                with os.scandir(path.parent) as entries:
+                    entries_by_dir[path.parent] = {entry.name for entry in entries}
+            except OSError:
+                entries_by_dir[path.parent] = set()
+        if path.name not in entries_by_dir[path.parent]:
+            logger.error("Configuration file not found: %s at %s", config_name, path)
             raise FileNotFoundError(
                 f"Configuration file not found: {config_name} at {path}"
             )